@@ -0,0 +1,59 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that must never be imported at CLI startup
+HEAVY_MODULES = ("pandas", "tqdm", "gradio")
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def time_command(cmd, runs):
+    """Run a command several times and return the wall-clock time of each run in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=PROJECT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def check_heavy_imports():
+    """Return the heavy modules that get loaded when importing the CLI and scraper modules."""
+    code = (
+        "import sys, instagram_cli, instagram_scraper; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+def main(argv=None):
+    """Benchmark cold start of the command-line interface against an interpreter baseline."""
+    parser = argparse.ArgumentParser(description="Measure startup time of instagram_cli.py.")
+    parser.add_argument("--runs", type=int, default=20, help="Number of runs per command (default: 20)")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="Fail if the CLI median startup exceeds this many milliseconds (default: 50)")
+    args = parser.parse_args(argv)
+
+    loaded = check_heavy_imports()
+    if loaded:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(loaded)}")
+        return 1
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    cli = time_command([sys.executable, "instagram_cli.py", "--help"], args.runs)
+
+    baseline_median = statistics.median(baseline)
+    cli_median = statistics.median(cli)
+    print(f"python -c pass           median {baseline_median:7.2f} ms  min {min(baseline):7.2f} ms")
+    print(f"instagram_cli.py --help  median {cli_median:7.2f} ms  min {min(cli):7.2f} ms")
+    print(f"CLI overhead over interpreter: {cli_median - baseline_median:.2f} ms")
+
+    if cli_median > args.max_ms:
+        print(f"FAIL: median startup {cli_median:.2f} ms exceeds {args.max_ms:.2f} ms")
+        return 1
+    print("OK")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
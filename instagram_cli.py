@@ -0,0 +1,119 @@
+import argparse
+import re
+import sys
+
+# Keep module-level imports to the standard library: instagram_scraper, tqdm and
+# gradio are imported inside the commands that need them so that short
+# invocations (cron jobs, --help) start fast.
+
+MEDIA_URL_PATTERN = re.compile(r"(?:reels?|tv|p)/[A-Za-z0-9_-]+/?")
+
+def parse_range(value):
+    """Validate a range given as 1 or 1-5 and return it as 'start-end'."""
+    try:
+        if '-' in value:
+            start, end = map(int, value.split('-'))
+        else:
+            start = end = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range '{value}', expected N or N-M")
+    if start < 1 or end < start:
+        raise argparse.ArgumentTypeError(f"invalid range '{value}', expected 1 <= N <= M")
+    return f"{start}-{end}"
+
+def read_batch_file(path):
+    """Read URLs or account names from a file (or stdin for '-'), skipping blanks and # comments."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            entries.append(line)
+    return entries
+
+def run_url(args):
+    """Scrape one or more post/reel URLs."""
+    from instagram_scraper import scrape_instagram
+    for url in args.urls:
+        scrape_instagram(input_data=url, is_url=True, base_path=args.base_path)
+    return 0
+
+def run_account(args):
+    """Scrape posts and reels for one or more accounts."""
+    from instagram_scraper import scrape_instagram
+    for account in args.accounts:
+        scrape_instagram(search=account, is_url=False, post_range=args.range, all_posts=args.all, base_path=args.base_path)
+    return 0
+
+def run_batch(args):
+    """Scrape every URL or account listed in a batch file."""
+    try:
+        entries = read_batch_file(args.file)
+    except OSError as e:
+        print(f"Error reading batch file {args.file}: {e}", file=sys.stderr)
+        return 1
+    if not entries:
+        print(f"No URLs or accounts found in {args.file}")
+        return 0
+
+    from instagram_scraper import scrape_instagram
+    for entry in entries:
+        if MEDIA_URL_PATTERN.search(entry):
+            scrape_instagram(input_data=entry, is_url=True, base_path=args.base_path)
+        else:
+            scrape_instagram(search=entry, is_url=False, post_range=args.range, all_posts=args.all, base_path=args.base_path)
+    return 0
+
+def run_gui(args):
+    """Launch the Gradio web interface."""
+    from instagram_gradio import create_interface
+    demo = create_interface()
+    demo.launch(server_name=args.host, server_port=args.port)
+    return 0
+
+def add_range_options(parser, required):
+    """Add the mutually exclusive --range/--all options used by account scraping."""
+    group = parser.add_mutually_exclusive_group(required=required)
+    group.add_argument("--range", type=parse_range, help="Range of posts/reels to download, e.g. 1 or 1-5")
+    group.add_argument("--all", action="store_true", help="Download all posts and reels")
+
+def build_parser():
+    """Build the argument parser for the command-line interface."""
+    parser = argparse.ArgumentParser(prog="instagram_cli", description="Scrape Instagram posts and reels using gallery-dl.")
+    parser.add_argument("--base-path", default=None, help="Output directory (default: date=DD-MM-YYYY)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    url_parser = subparsers.add_parser("url", help="Download posts or reels by URL")
+    url_parser.add_argument("urls", nargs="+", help="Instagram post or reel URL(s)")
+    url_parser.set_defaults(func=run_url)
+
+    account_parser = subparsers.add_parser("account", help="Download posts and reels from account(s)")
+    account_parser.add_argument("accounts", nargs="+", help="Account name(s) or profile URL(s)")
+    add_range_options(account_parser, required=True)
+    account_parser.set_defaults(func=run_account)
+
+    batch_parser = subparsers.add_parser("batch", help="Download URLs and accounts listed in a file, one per line")
+    batch_parser.add_argument("file", help="Path to the batch file, or '-' to read from stdin")
+    # Without --range or --all, accounts in the batch file are scraped in full
+    add_range_options(batch_parser, required=False)
+    batch_parser.set_defaults(func=run_batch)
+
+    gui_parser = subparsers.add_parser("gui", help="Launch the Gradio web interface")
+    gui_parser.add_argument("--host", default=None, help="Host to bind the web server to")
+    gui_parser.add_argument("--port", type=int, default=None, help="Port to bind the web server to")
+    gui_parser.set_defaults(func=run_gui)
+
+    return parser
+
+def main(argv=None):
+    """Entry point for the command-line interface."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    raise SystemExit(main())
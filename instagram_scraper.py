@@ -4,10 +4,8 @@ import json
 import subprocess
 import datetime
 import time
-import pandas as pd
 from urllib.parse import urlparse
 import re
-from tqdm import tqdm
 import uuid
 
 def setup_directories(base_path=None):
@@ -33,7 +31,8 @@ def setup_directories(base_path=None):
 def load_media_ids(media_ids_file):
     """Load previously downloaded media IDs as strings."""
     if os.path.exists(media_ids_file):
-        return set(pd.read_csv(media_ids_file, dtype={"media_id": str})["media_id"])
+        with open(media_ids_file, "r", newline="", encoding="utf-8") as f:
+            return {row["media_id"] for row in csv.DictReader(f) if row.get("media_id")}
     return set()
 
 def save_media_id(media_ids_file, media_id):
@@ -335,6 +334,9 @@ def scrape_instagram(input_data=None, is_url=True, search=None, post_range=None,
         if not post_results:
             print(f"No posts found for account: {account_name}. Account may be private, empty, or inaccessible.")
         
+        # tqdm is only needed for account scraping, keep it out of URL-only startup
+        from tqdm import tqdm
+        
         downloaded_count = 0
         
         if post_results:
@@ -426,13 +428,5 @@ def scrape_instagram(input_data=None, is_url=True, search=None, post_range=None,
         print(f"Downloaded {downloaded_count} items (posts and reels) for account: {account_name}")
 
 if __name__ == "__main__":
-    # Example usage
-    # Single post/reel URLs
-    scrape_instagram(input_data="https://www.instagram.com/reel/DIuxxtjPcnE/", is_url=True)
-    scrape_instagram(input_data="https://www.instagram.com/p/DIyBHpaJHvZ/", is_url=True)
-    
-    # Account-based scraping for all posts and reels
-    # scrape_instagram(search="dhwanit.vsit", is_url=False, all_posts=True)
-    
-    # Account-based scraping with range mode (e.g., posts/reels 1-2)
-    scrape_instagram(search="dhwanit.vsit", is_url=False, post_range="1-3")
+    from instagram_cli import main
+    raise SystemExit(main())